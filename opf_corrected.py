@@ -4,12 +4,14 @@ Uses Pyomo for optimization modeling.
 - AC OPF: Solved via NEOS Server (IPOPT nonlinear solver)
 - DC OPF: Solved locally via HiGHS (linear solver)
 """
+import functools
 import os
+import sys
 import numpy as np
 import pyomo.environ as pyo
-
-# NEOS server requires an email
-os.environ['NEOS_EMAIL'] = 'user@example.com'
+import scipy.sparse as sp
+from pyomo.contrib.appsi.solvers import Highs
+from pyomo.core.expr.numeric_expr import LinearExpression
 
 N_BUS = 5
 
@@ -46,98 +48,245 @@ LINE_DATA = [
     (3, 4, 0.08, 0.24),
 ]
 
+# Typed views of LINE_DATA for the admittance triplet builders
+LINE_EDGES = np.array([(i, j) for (i, j, _, _) in LINE_DATA], dtype=np.int64)
+LINE_RX = np.array([(r, x) for (_, _, r, x) in LINE_DATA], dtype=np.float64)
+
+
+# Struct-of-arrays views of BUS_DATA, indexed by bus, used by the builders
+def _bus_column(key):
+    """Return one BUS_DATA field as a float array indexed by bus."""
+    return np.array([BUS_DATA[i][key] for i in range(N_BUS)], dtype=np.float64)
+
+
+PGMAX, PGMIN = _bus_column('PGmax'), _bus_column('PGmin')
+QGMAX, QGMIN = _bus_column('QGmax'), _bus_column('QGmin')
+PLOAD, QLOAD = _bus_column('Pload'), _bus_column('Qload')
+VMAX, VMIN = _bus_column('Vmax'), _bus_column('Vmin')
+COST_A, COST_B, COST_C = _bus_column('a'), _bus_column('b'), _bus_column('c')
+TOTAL_LOAD = float(PLOAD.sum())
+
 # Derived sets
-GEN_BUSES = [i for i in range(N_BUS) if BUS_DATA[i]['PGmax'] > 0]
-LOAD_BUSES = [i for i in range(N_BUS) if i not in GEN_BUSES]
+GEN_BUSES = [i for i in range(N_BUS) if PGMAX[i] > 0]
 
 
-def build_admittance_matrices():
-    """Build G (conductance) and B (susceptance) matrices from line data."""
-    G = np.zeros((N_BUS, N_BUS))
-    B = np.zeros((N_BUS, N_BUS))
+# Below this many lines the vectorized NumPy path beats Numba's compile cost
+JIT_MIN_LINES = 1000
+
+
+def _admittance_triplets(edges, rx):
+    """Return COO (rows, cols, g, b) entries of Ybus, four per line."""
+    i, j = edges[:, 0], edges[:, 1]
+    r, x = rx[:, 0], rx[:, 1]
+    z_sq = r * r + x * x
+    g = r / z_sq
+    b = -x / z_sq
 
-    for (i, j, r, x) in LINE_DATA:
-        z_sq = r**2 + x**2
-        g_ij = r / z_sq
-        b_ij = -x / z_sq
+    # diagonal (i,i), (j,j) and off-diagonal (i,j), (j,i)
+    rows = np.concatenate((i, j, i, j))
+    cols = np.concatenate((i, j, j, i))
+    g_vals = np.concatenate((g, g, -g, -g))
+    b_vals = np.concatenate((b, b, -b, -b))
+    return rows, cols, g_vals, b_vals
 
-        G[i, i] += g_ij;  G[j, j] += g_ij
-        G[i, j] -= g_ij;  G[j, i] -= g_ij
-        B[i, i] += b_ij;  B[j, j] += b_ij
-        B[i, j] -= b_ij;  B[j, i] -= b_ij
+
+@functools.lru_cache(maxsize=1)
+def _load_admittance_triplets_jit():
+    """Compile the Numba triplet kernel on first use; None without Numba.
+
+    Numba is optional and only imported here, so importing this module stays
+    cheap. The compiled kernel is checked once against the NumPy version.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    @numba.njit(cache=True)
+    def _admittance_triplets_jit(edges, rx):
+        """Compiled single-pass equivalent of ``_admittance_triplets``."""
+        n_lines = edges.shape[0]
+        rows = np.empty(4 * n_lines, dtype=np.int64)
+        cols = np.empty(4 * n_lines, dtype=np.int64)
+        g_vals = np.empty(4 * n_lines)
+        b_vals = np.empty(4 * n_lines)
+        for e in range(n_lines):
+            i = edges[e, 0]
+            j = edges[e, 1]
+            r = rx[e, 0]
+            x = rx[e, 1]
+            z_sq = r * r + x * x
+            g = r / z_sq
+            b = -x / z_sq
+
+            # same block layout as the NumPy version
+            rows[e], cols[e] = i, i
+            rows[n_lines + e], cols[n_lines + e] = j, j
+            rows[2 * n_lines + e], cols[2 * n_lines + e] = i, j
+            rows[3 * n_lines + e], cols[3 * n_lines + e] = j, i
+            g_vals[e], g_vals[n_lines + e] = g, g
+            g_vals[2 * n_lines + e], g_vals[3 * n_lines + e] = -g, -g
+            b_vals[e], b_vals[n_lines + e] = b, b
+            b_vals[2 * n_lines + e], b_vals[3 * n_lines + e] = -b, -b
+        return rows, cols, g_vals, b_vals
+
+    expected = _admittance_triplets(LINE_EDGES, LINE_RX)
+    actual = _admittance_triplets_jit(LINE_EDGES, LINE_RX)
+    if not all(np.allclose(a, b) for a, b in zip(expected, actual)):
+        raise RuntimeError("Numba admittance kernel disagrees with the NumPy version")
+    return _admittance_triplets_jit
+
+
+@functools.lru_cache(maxsize=1)
+def build_admittance_matrices():
+    """Build G (conductance) and B (susceptance) matrices from line data.
+
+    Both are returned as CSR matrices sharing the same sparsity pattern,
+    so ``G.indptr``/``G.indices`` also enumerate the entries of ``B``.
+    The result is cached (the line data is fixed), so the AC and DC
+    builders share one pair of matrices; treat them as read-only.
+    """
+    triplets = None
+    if len(LINE_EDGES) >= JIT_MIN_LINES:
+        triplets = _load_admittance_triplets_jit()
+    if triplets is None:
+        triplets = _admittance_triplets
+    rows, cols, g_vals, b_vals = triplets(LINE_EDGES, LINE_RX)
+
+    # Duplicate entries are summed on conversion to CSR
+    G = sp.csr_matrix((g_vals, (rows, cols)), shape=(N_BUS, N_BUS))
+    B = sp.csr_matrix((b_vals, (rows, cols)), shape=(N_BUS, N_BUS))
+    G.sum_duplicates()
+    B.sum_duplicates()
 
     return G, B
 
 
+def split_admittance(G, B):
+    """Split CSR admittance matrices into Python-float lookups.
+
+    Returns ``(g_diag, b_diag, arcs)`` where ``g_diag[i]``/``b_diag[i]`` are
+    the diagonal entries and ``arcs[i]`` lists ``(k, g_ik, b_ik)`` for every
+    off-diagonal entry of row ``i`` that is not exactly zero.
+    """
+    # Buses with no incident lines have no stored diagonal; default to 0.0
+    g_diag = dict.fromkeys(range(N_BUS), 0.0)
+    b_diag = dict.fromkeys(range(N_BUS), 0.0)
+    arcs = {i: [] for i in range(N_BUS)}
+    for i in range(N_BUS):
+        for idx in range(G.indptr[i], G.indptr[i + 1]):
+            k = int(G.indices[idx])
+            g_ik, b_ik = float(G.data[idx]), float(B.data[idx])
+            if k == i:
+                g_diag[i], b_diag[i] = g_ik, b_ik
+            elif g_ik != 0.0 or b_ik != 0.0:
+                arcs[i].append((k, g_ik, b_ik))
+    return g_diag, b_diag, arcs
+
+
+@functools.lru_cache(maxsize=1)
+def build_dc_bbus():
+    """Build the DC power-flow matrix with the slack-bus column removed.
+
+    With ``theta[0] = 0`` the nodal injections are ``P = Bbus @ theta[1:]``,
+    where ``Bbus = diag(sum_k B_ik) - B`` over the off-diagonal entries of B.
+    All rows are kept so the slack bus still has its own balance equation.
+    """
+    _, B = build_admittance_matrices()
+    B_off = B - sp.diags(B.diagonal())
+    Bbus = sp.diags(np.asarray(B_off.sum(axis=1)).ravel()) - B_off
+    Bbus = sp.csr_matrix(Bbus)[:, 1:]
+    Bbus.eliminate_zeros()
+    return Bbus
+
+
 def build_ac_model():
-    """Build AC OPF Pyomo model with full nonlinear power flow."""
-    G, B = build_admittance_matrices()
+    """Build AC OPF Pyomo model with full nonlinear power flow.
+
+    Bus voltages use rectangular coordinates (``m.e``, ``m.f``), which keeps
+    the power-balance equations polynomial.
+    """
+    g_diag, b_diag, arcs = split_admittance(*build_admittance_matrices())
     m = pyo.ConcreteModel("AC_OPF")
     m.buses = pyo.Set(initialize=range(N_BUS))
+    m.gen_buses = pyo.Set(initialize=GEN_BUSES)
 
-    # Parameters (using Pyomo Param for proper modeling)
-    m.Pload = pyo.Param(m.buses, initialize={i: BUS_DATA[i]['Pload'] for i in range(N_BUS)})
-    m.Qload = pyo.Param(m.buses, initialize={i: BUS_DATA[i]['Qload'] for i in range(N_BUS)})
+    # Parameters (mutable, so loads can be updated without rebuilding)
+    m.Pload = pyo.Param(m.buses, mutable=True,
+                        initialize={i: PLOAD[i] for i in range(N_BUS)})
+    m.Qload = pyo.Param(m.buses, mutable=True,
+                        initialize={i: QLOAD[i] for i in range(N_BUS)})
 
     # Variables with initialization
-    total_load = sum(BUS_DATA[i]['Pload'] for i in range(N_BUS))
-    m.Pg = pyo.Var(m.buses, within=pyo.Reals, initialize={0: total_load, 1: 0.1, 2: 0.1, 3: 0, 4: 0})
-    m.Qg = pyo.Var(m.buses, within=pyo.Reals, initialize=0.0)
-    m.V = pyo.Var(m.buses, within=pyo.NonNegativeReals,
+    # Generation only exists at generator buses; load buses contribute 0
+    m.Pg = pyo.Var(m.gen_buses, within=pyo.Reals,
+                   initialize={i: TOTAL_LOAD if i == 0 else 0.1 for i in GEN_BUSES})
+    m.Qg = pyo.Var(m.gen_buses, within=pyo.Reals, initialize=0.0)
+    # Rectangular bus voltages: e = |V| cos(theta), f = |V| sin(theta)
+    m.e = pyo.Var(m.buses, within=pyo.Reals,
                   initialize={i: 1.06 if i == 0 else 1.0 for i in range(N_BUS)})
-    m.theta = pyo.Var(m.buses, within=pyo.Reals, initialize=0.0)
+    m.f = pyo.Var(m.buses, within=pyo.Reals, initialize=0.0)
 
-    # Fix slack bus
-    m.V[0].fix(1.06)
-    m.theta[0].fix(0.0)
-
-    # Fix non-generator buses to zero generation
-    for i in LOAD_BUSES:
-        m.Pg[i].fix(0.0)
-        m.Qg[i].fix(0.0)
+    # Fix slack bus (|V| = 1.06, theta = 0)
+    m.e[0].fix(1.06)
+    m.f[0].fix(0.0)
 
     # Set variable bounds directly (more efficient than constraint functions)
+    for i in GEN_BUSES:
+        m.Pg[i].setlb(PGMIN[i])
+        m.Pg[i].setub(PGMAX[i])
+        m.Qg[i].setlb(QGMIN[i])
+        m.Qg[i].setub(QGMAX[i])
     for i in range(N_BUS):
-        m.Pg[i].setlb(BUS_DATA[i]['PGmin'])
-        m.Pg[i].setub(BUS_DATA[i]['PGmax'])
-        m.Qg[i].setlb(BUS_DATA[i]['QGmin'])
-        m.Qg[i].setub(BUS_DATA[i]['QGmax'])
-        m.V[i].setlb(BUS_DATA[i]['Vmin'])
-        m.V[i].setub(BUS_DATA[i]['Vmax'])
-        m.theta[i].setlb(-np.pi)
-        m.theta[i].setub(np.pi)
+        m.e[i].setlb(-VMAX[i])
+        m.e[i].setub(VMAX[i])
+        m.f[i].setlb(-VMAX[i])
+        m.f[i].setub(VMAX[i])
+
+    # Voltage magnitude limits: Vmin^2 <= e^2 + f^2 <= Vmax^2
+    m.v_sq = pyo.Expression(m.buses, rule=lambda m, i: m.e[i]**2 + m.f[i]**2)
+
+    def v_limits_rule(m, i):
+        if m.e[i].fixed and m.f[i].fixed:
+            return pyo.Constraint.Skip
+        return (VMIN[i]**2, m.v_sq[i], VMAX[i]**2)
+
+    m.v_limits = pyo.Constraint(m.buses, rule=v_limits_rule)
 
     # Objective: minimize quadratic generation cost
     m.obj = pyo.Objective(
-        expr=sum(
-            BUS_DATA[i]['a'] * m.Pg[i]**2 +
-            BUS_DATA[i]['b'] * m.Pg[i] +
-            BUS_DATA[i]['c']
+        expr=pyo.quicksum(
+            COST_A[i] * m.Pg[i]**2 +
+            COST_B[i] * m.Pg[i] +
+            COST_C[i]
             for i in GEN_BUSES
         ),
         sense=pyo.minimize
     )
 
-    # AC Power Flow equations (nodal power balance)
+    # AC Power Flow equations (nodal power balance) in rectangular form:
+    #   V_i V_k cos(theta_i - theta_k) = e_i e_k + f_i f_k
+    #   V_i V_k sin(theta_i - theta_k) = f_i e_k - e_i f_k
+    # so the balance is polynomial in (e, f) with no trigonometric terms.
+    # Only structural nonzeros of Ybus contribute; the diagonal term reduces
+    # to V_i^2 = e_i^2 + f_i^2.
     def p_balance_rule(m, i):
-        Pflow = sum(
-            m.V[i] * m.V[k] * (
-                float(G[i, k]) * pyo.cos(m.theta[i] - m.theta[k]) +
-                float(B[i, k]) * pyo.sin(m.theta[i] - m.theta[k])
-            )
-            for k in range(N_BUS)
+        Pflow = m.v_sq[i] * g_diag[i] + sum(
+            g_ik * (m.e[i] * m.e[k] + m.f[i] * m.f[k]) +
+            b_ik * (m.f[i] * m.e[k] - m.e[i] * m.f[k])
+            for (k, g_ik, b_ik) in arcs[i]
         )
-        return m.Pg[i] - m.Pload[i] == Pflow
+        Pgen = m.Pg[i] if i in m.gen_buses else 0.0
+        return Pgen - m.Pload[i] == Pflow
 
     def q_balance_rule(m, i):
-        Qflow = sum(
-            m.V[i] * m.V[k] * (
-                float(G[i, k]) * pyo.sin(m.theta[i] - m.theta[k]) -
-                float(B[i, k]) * pyo.cos(m.theta[i] - m.theta[k])
-            )
-            for k in range(N_BUS)
+        Qflow = -m.v_sq[i] * b_diag[i] + sum(
+            g_ik * (m.f[i] * m.e[k] - m.e[i] * m.f[k]) -
+            b_ik * (m.e[i] * m.e[k] + m.f[i] * m.f[k])
+            for (k, g_ik, b_ik) in arcs[i]
         )
-        return m.Qg[i] - m.Qload[i] == Qflow
+        Qgen = m.Qg[i] if i in m.gen_buses else 0.0
+        return Qgen - m.Qload[i] == Qflow
 
     m.p_balance = pyo.Constraint(m.buses, rule=p_balance_rule)
     m.q_balance = pyo.Constraint(m.buses, rule=q_balance_rule)
@@ -150,47 +299,141 @@ def build_dc_model():
 
     Assumptions: V=1.0 pu, small angles, lossless lines.
     """
-    _, B = build_admittance_matrices()
+    Bbus = build_dc_bbus()
     m = pyo.ConcreteModel("DC_OPF")
     m.buses = pyo.Set(initialize=range(N_BUS))
+    m.gen_buses = pyo.Set(initialize=GEN_BUSES)
 
-    # Parameters
-    m.Pload = pyo.Param(m.buses, initialize={i: BUS_DATA[i]['Pload'] for i in range(N_BUS)})
+    # Parameters (mutable, so loads can be updated without rebuilding)
+    m.Pload = pyo.Param(m.buses, mutable=True,
+                        initialize={i: PLOAD[i] for i in range(N_BUS)})
 
     # Variables
-    m.Pg = pyo.Var(m.buses, within=pyo.Reals, initialize=0.0)
+    m.Pg = pyo.Var(m.gen_buses, within=pyo.Reals, initialize=0.0)
     m.theta = pyo.Var(m.buses, within=pyo.Reals, initialize=0.0)
 
     # Fix slack bus angle
     m.theta[0].fix(0.0)
 
-    # Fix non-generator buses
-    for i in LOAD_BUSES:
-        m.Pg[i].fix(0.0)
-
     # Set bounds
+    for i in GEN_BUSES:
+        m.Pg[i].setlb(PGMIN[i])
+        m.Pg[i].setub(PGMAX[i])
     for i in range(N_BUS):
-        m.Pg[i].setlb(BUS_DATA[i]['PGmin'])
-        m.Pg[i].setub(BUS_DATA[i]['PGmax'])
         m.theta[i].setlb(-np.pi)
         m.theta[i].setub(np.pi)
 
     # Linear objective: sum(b_i * Pg_i) — standard DC OPF uses linear cost
     m.obj = pyo.Objective(
-        expr=sum(BUS_DATA[i]['b'] * m.Pg[i] for i in GEN_BUSES),
+        expr=LinearExpression(
+            constant=0.0,
+            linear_coefs=[COST_B[i] for i in GEN_BUSES],
+            linear_vars=[m.Pg[i] for i in GEN_BUSES],
+        ),
         sense=pyo.minimize
     )
 
-    # DC Power Flow: Pg_i - Pload_i = sum(B_ij * (theta_i - theta_j))
+    # DC Power Flow: Pg_i - Pload_i = (Bbus @ theta)_i, one flat
+    # LinearExpression per CSR row of the reduced Bbus
     def p_balance_rule(m, i):
-        Pflow = sum(float(B[i, k]) * (m.theta[i] - m.theta[k]) for k in range(N_BUS))
-        return m.Pg[i] - m.Pload[i] == Pflow
+        lo, hi = Bbus.indptr[i], Bbus.indptr[i + 1]
+        Pflow = LinearExpression(
+            constant=0.0,
+            linear_coefs=[float(v) for v in Bbus.data[lo:hi]],
+            linear_vars=[m.theta[int(k) + 1] for k in Bbus.indices[lo:hi]],
+        )
+        Pgen = m.Pg[i] if i in m.gen_buses else 0.0
+        return Pgen - m.Pload[i] == Pflow
 
     m.p_balance = pyo.Constraint(m.buses, rule=p_balance_rule)
 
     return m
 
 
+def set_loads(m, Pd, Qd=None):
+    """Update bus loads in place on a model from build_ac_model/build_dc_model.
+
+    ``Pd`` and ``Qd`` are indexable by bus number. ``Qd`` is ignored for
+    DC models, which have no reactive load. Re-solving the same model after
+    this call avoids rebuilding its expressions.
+    """
+    for i in m.buses:
+        m.Pload[i] = float(Pd[i])
+    if Qd is not None and hasattr(m, 'Qload'):
+        for i in m.buses:
+            m.Qload[i] = float(Qd[i])
+
+
+def make_dc_solver(m):
+    """Return a persistent APPSI HiGHS solver with DC model ``m`` loaded.
+
+    Between solves only the mutable load Params change, so the structural
+    update checks are disabled; Param updates stay on, so loads changed with
+    ``set_loads`` are picked up by the next ``opt.solve(m)``. HiGHS keeps the
+    LP and its basis in memory and warm-starts from it.
+    """
+    opt = Highs()
+    if not opt.available():
+        raise RuntimeError("HiGHS not available. Install: pip install highspy")
+    opt.config.load_solution = True
+
+    uc = opt.update_config
+    uc.check_for_new_or_removed_constraints = False
+    uc.check_for_new_or_removed_vars = False
+    uc.check_for_new_or_removed_params = False
+    uc.check_for_new_objective = False
+    uc.update_constraints = False
+    uc.update_vars = False
+    uc.update_named_expressions = False
+    uc.update_objective = False
+
+    opt.set_instance(m)
+    return opt
+
+
+def solve_dc_series(m, load_profile, opt=None):
+    """Re-solve DC model ``m`` for each active-load vector in ``load_profile``.
+
+    The model and the persistent solver are built once; each step only
+    updates the loads and re-solves. Returns the list of generation costs.
+    """
+    if opt is None:
+        opt = make_dc_solver(m)
+    costs = []
+    for Pd in load_profile:
+        set_loads(m, Pd)
+        results = opt.solve(m)
+        costs.append(results.best_feasible_objective)
+    return costs
+
+
+def warm_start_from_dc(m_ac, m_dc):
+    """Seed an AC model's initial point from a solved DC model.
+
+    Generator outputs are copied directly; bus angles from the DC solution
+    are applied to the initial voltage magnitudes in rectangular form.
+    Fixed (slack) variables are left untouched.
+    """
+    for i in m_ac.gen_buses:
+        if m_dc.Pg[i].value is not None:
+            m_ac.Pg[i].set_value(m_dc.Pg[i].value)
+    for i in m_ac.buses:
+        theta = m_dc.theta[i].value
+        if theta is None or m_ac.e[i].fixed:
+            continue
+        v = np.hypot(m_ac.e[i].value, m_ac.f[i].value)
+        m_ac.e[i].set_value(v * np.cos(theta))
+        m_ac.f[i].set_value(v * np.sin(theta))
+
+
+def _value_array(var, buses):
+    """Return ``var`` values over ``buses`` as an array (0.0 if unset or absent)."""
+    return np.array([
+        var[i].value if i in var and var[i].value is not None else 0.0
+        for i in buses
+    ])
+
+
 def print_results(m, ac=True):
     """Print optimization results in a formatted table."""
     print("\n" + "-" * 60)
@@ -203,15 +446,25 @@ def print_results(m, ac=True):
     print(header)
     print("-" * 60)
 
-    for i in m.buses:
-        pg = m.Pg[i].value if m.Pg[i].value is not None else 0.0
-        theta = np.degrees(m.theta[i].value) if m.theta[i].value is not None else 0.0
-        line = f"{i+1:<6}{pg:<12.4f}{theta:<14.4f}"
+    buses = list(m.buses)
+    pg = _value_array(m.Pg, buses)
+    if ac:
+        # Recover polar voltage from the rectangular (e, f) solution
+        e = _value_array(m.e, buses)
+        f = _value_array(m.f, buses)
+        theta = np.degrees(np.arctan2(f, e))
+        v = np.hypot(e, f)
+        qg = _value_array(m.Qg, buses)
+    else:
+        theta = np.degrees(_value_array(m.theta, buses))
+
+    rows = []
+    for n, i in enumerate(buses):
+        line = f"{i+1:<6}{pg[n]:<12.4f}{theta[n]:<14.4f}"
         if ac:
-            v = m.V[i].value if m.V[i].value is not None else 0.0
-            qg = m.Qg[i].value if m.Qg[i].value is not None else 0.0
-            line += f"{v:<12.4f}{qg:<12.4f}"
-        print(line)
+            line += f"{v[n]:<12.4f}{qg[n]:<12.4f}"
+        rows.append(line)
+    sys.stdout.write("\n".join(rows) + "\n")
 
     cost = pyo.value(m.obj)
     print(f"\nTotal Generation Cost: {cost:.4f}")
@@ -219,14 +472,38 @@ def print_results(m, ac=True):
 
 
 def main():
-    """Run both AC and DC OPF."""
+    """Run both AC and DC OPF (DC first, to warm-start the AC solve)."""
 
-    # ── AC OPF ─────────────────────────────────────
+    # ── DC OPF ─────────────────────────────────────
     print("=" * 60)
+    print("DC OPTIMAL POWER FLOW (HiGHS)")
+    print("=" * 60)
+
+    model_dc = build_dc_model()
+
+    try:
+        solver = make_dc_solver(model_dc)
+        solver.config.stream_solver = True
+        results_dc = solver.solve(model_dc)
+        status = results_dc.termination_condition.name
+        print(f"\nSolver status: {status}")
+        dc_cost = print_results(model_dc, ac=False)
+    except Exception as e:
+        print(f"\nDC OPF failed: {e}")
+        dc_cost = None
+
+    # ── AC OPF ─────────────────────────────────────
+    print("\n" + "=" * 60)
     print("AC OPTIMAL POWER FLOW (NEOS + IPOPT)")
     print("=" * 60)
 
     model_ac = build_ac_model()
+    if dc_cost is not None:
+        warm_start_from_dc(model_ac, model_dc)
+
+    # NEOS server requires an email; keep one the caller already exported
+    if os.environ.get('NEOS_EMAIL') is None:
+        os.environ['NEOS_EMAIL'] = 'user@example.com'
 
     try:
         solver_mgr = pyo.SolverManagerFactory('neos')
@@ -239,31 +516,11 @@ def main():
         print("Ensure NEOS_EMAIL is set and you have internet access.")
         ac_cost = None
 
-    # ── DC OPF ─────────────────────────────────────
-    print("\n" + "=" * 60)
-    print("DC OPTIMAL POWER FLOW (HiGHS)")
-    print("=" * 60)
-
-    model_dc = build_dc_model()
-
-    try:
-        solver = pyo.SolverFactory('appsi_highs')
-        if not solver.available():
-            raise RuntimeError("HiGHS not available. Install: pip install highspy")
-        results_dc = solver.solve(model_dc, tee=True)
-        status = str(results_dc.solver.termination_condition)
-        print(f"\nSolver status: {status}")
-        dc_cost = print_results(model_dc, ac=False)
-    except Exception as e:
-        print(f"\nDC OPF failed: {e}")
-        dc_cost = None
-
     # ── Summary ────────────────────────────────────
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
-    total_load = sum(BUS_DATA[i]['Pload'] for i in range(N_BUS))
-    print(f"Total System Load: {total_load:.2f} MW")
+    print(f"Total System Load: {TOTAL_LOAD:.2f} MW")
     if ac_cost is not None:
         print(f"AC OPF Cost: {ac_cost:.4f} (with losses)")
     if dc_cost is not None:
@@ -5,6 +5,35 @@ import pyomo.environ as pyo
 import json
 
 
+def get_values(var, nodes):
+    """
+    Extract the values of an indexed Pyomo variable in one pass.
+
+    Parameters:
+    -----------
+    var : pyomo Var
+        Indexed variable (e.g. model.x_p)
+    nodes : iterable
+        Indices to read
+
+    Returns:
+    --------
+    list
+        Values in node order, None where the variable has no value
+    """
+    return [var[i].value for i in nodes]
+
+
+def print_node_values(title, nodes, values):
+    """Print one per-node result column, marking missing values."""
+    rows = [f"\nNode\t\t{title}"]
+    rows.extend(
+        f"{i+1} \t\t {value if value is not None else 'Not solved'}"
+        for i, value in zip(nodes, values)
+    )
+    print("\n".join(rows))
+
+
 def solve_and_print(model, AC=True):
     """
     Solve the OPF model and print results.
@@ -22,52 +51,28 @@ def solve_and_print(model, AC=True):
         solver_manager = pyo.SolverManagerFactory('neos')
         results = solver_manager.solve(model, opt='conopt', tee=True)
     else:
-        # Try available solvers for linear DC OPF
-        for solver_name in ['glpk', 'cbc', 'appsi_highs']:
+        # Try available solvers for linear DC OPF, fastest LP solvers first
+        for solver_name in ['appsi_highs', 'gurobi_persistent', 'cplex_persistent', 'glpk', 'cbc']:
             solver = pyo.SolverFactory(solver_name)
-            if solver.available():
+            if solver.available(exception_flag=False):
                 print(f"Using solver: {solver_name}")
+                if solver_name.endswith('_persistent'):
+                    solver.set_instance(model)
                 results = solver.solve(model, tee=True)
                 break
         else:
-            raise RuntimeError("No suitable solver found. Install glpk, cbc, or scipy.")
+            raise RuntimeError("No suitable solver found. Install highspy, glpk, or cbc.")
 
     # Print results
     print("\n\nSolution\n")
 
-    # Voltage angles
-    print("\nNode\t\tVoltage angle [deg]")
-    for i in model.nodes:
-        if hasattr(model.x_v_angle[i], 'value') and model.x_v_angle[i].value is not None:
-            print(f"{i+1} \t\t {model.x_v_angle[i].value}")
-        else:
-            print(f"{i+1} \t\t Not solved")
-
-    # Voltage magnitudes (AC only)
+    nodes = list(model.nodes)
+    print_node_values("Voltage angle [deg]", nodes, get_values(model.x_v_angle, nodes))
     if AC:
-        print("\nNode\t\tVoltage magnitude")
-        for i in model.nodes:
-            if hasattr(model.x_v[i], 'value') and model.x_v[i].value is not None:
-                print(f"{i+1} \t\t {model.x_v[i].value}")
-            else:
-                print(f"{i+1} \t\t Not solved")
-
-    # Real power
-    print("\nNode\t\tPower")
-    for i in model.nodes:
-        if hasattr(model.x_p[i], 'value') and model.x_p[i].value is not None:
-            print(f"{i+1} \t\t {model.x_p[i].value}")
-        else:
-            print(f"{i+1} \t\t Not solved")
-
-    # Reactive power (AC only)
+        print_node_values("Voltage magnitude", nodes, get_values(model.x_v, nodes))
+    print_node_values("Power", nodes, get_values(model.x_p, nodes))
     if AC:
-        print("\nNode\t\tReactive Power")
-        for i in model.nodes:
-            if hasattr(model.x_q[i], 'value') and model.x_q[i].value is not None:
-                print(f"{i+1} \t\t {model.x_q[i].value}")
-            else:
-                print(f"{i+1} \t\t Not solved")
+        print_node_values("Reactive Power", nodes, get_values(model.x_q, nodes))
 
     # Objective value
     if hasattr(model.objective_function, 'expr'):
@@ -90,23 +95,23 @@ def create_results_json(model, team_name, AC=True):
     AC : bool
         True for AC OPF, False for DC OPF
     """
+    nodes = list(model.nodes)
+    columns = {
+        'voltage_angle': get_values(model.x_v_angle, nodes),
+        'power': get_values(model.x_p, nodes),
+    }
+    if AC:
+        columns['voltage_magnitude'] = get_values(model.x_v, nodes)
+        columns['reactive_power'] = get_values(model.x_q, nodes)
+
     results = {
         'team_name': team_name,
         'model_type': 'AC_OPF' if AC else 'DC_OPF',
-        'nodes': {}
-    }
-
-    for i in model.nodes:
-        node_data = {
-            'voltage_angle': model.x_v_angle[i].value if hasattr(model.x_v_angle[i], 'value') else None,
-            'power': model.x_p[i].value if hasattr(model.x_p[i], 'value') else None
+        'nodes': {
+            f'node_{i+1}': {key: values[n] for key, values in columns.items()}
+            for n, i in enumerate(nodes)
         }
-
-        if AC:
-            node_data['voltage_magnitude'] = model.x_v[i].value if hasattr(model.x_v[i], 'value') else None
-            node_data['reactive_power'] = model.x_q[i].value if hasattr(model.x_q[i], 'value') else None
-
-        results['nodes'][f'node_{i+1}'] = node_data
+    }
 
     # Add cost
     if hasattr(model.objective_function, 'expr'):